@@ -4,9 +4,8 @@ import argparse
 import logging
 import sys
 import webbrowser
-from urllib.parse import urlparse
 
-from .fetcher import fetch_article, FetchError
+from .fetcher import fetch_article, is_medium_url, FetchError
 from .parser import parse_article, ParseError
 from .generator import generate_html
 from .storage import save_article
@@ -21,9 +20,7 @@ def validate_url(url: str) -> bool:
     Returns:
         bool: True if URL appears to be a Medium URL
     """
-    parsed = urlparse(url)
-    medium_domains = ['medium.com', 'www.medium.com']
-    return parsed.netloc in medium_domains or parsed.netloc.endswith('.medium.com')
+    return is_medium_url(url)
 
 
 def main():
@@ -42,6 +39,11 @@ def main():
         action='store_true',
         help='Do not open the article in browser after fetching'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Bypass the local HTTP cache and always fetch from the network'
+    )
     parser.add_argument(
         '--debug',
         action='store_true',
@@ -74,7 +76,7 @@ def main():
     # Fetch article
     print(f"Fetching article from {args.url}...")
     try:
-        html = fetch_article(args.url, debug=args.debug)
+        html = fetch_article(args.url, debug=args.debug, cache=not args.no_cache)
     except FetchError as e:
         print(f"Error: {e}", file=sys.stderr)
         if args.debug:
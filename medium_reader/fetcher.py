@@ -1,8 +1,28 @@
 """Article fetching logic for Medium articles."""
 
+import asyncio
+import codecs
+import contextlib
 import logging
+import os
+import re
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from typing import Optional, Tuple
+from urllib.parse import urlparse
+from lxml import etree, html as lxml_html
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import aiohttp
+except ImportError:  # optional, only needed for fetch_article_async
+    aiohttp = None
+
+try:
+    import requests_cache
+except ImportError:  # optional, enables the on-disk HTTP cache
+    requests_cache = None
 
 logger = logging.getLogger(__name__)
 
@@ -27,10 +47,69 @@ DEFAULT_HEADERS = {
     'DNT': '1',
 }
 
+# Only advertise the encodings urllib3 can actually decode here: br and zstd
+# depend on optional codec packages (urllib3[brotli,zstd])
+_SUPPORTED_ACCEPT_ENCODING = ', '.join(ACCEPT_ENCODING.split(','))
+
+# The aiohttp session decodes with aiohttp's own codecs, independently of
+# urllib3: br needs a brotli package and zstd needs aiohttp 3.12+
+_aiohttp_compression = getattr(aiohttp, 'compression_utils', None)
+_AIOHTTP_ACCEPT_ENCODING = ', '.join(
+    ['gzip', 'deflate']
+    + (['br'] if getattr(_aiohttp_compression, 'HAS_BROTLI', False) else [])
+    + (['zstd'] if getattr(_aiohttp_compression, 'HAS_ZSTD', False) else [])
+)
+
+# Per-request referrer headers; everything else comes from the session's
+# DEFAULT_HEADERS via requests' header merging
+_HEADERS_MEDIUM = {
+    'Referer': 'https://medium.com/',
+    'Sec-Fetch-Site': 'same-origin',
+}
+_HEADERS_EXTERNAL = {
+    'Referer': 'https://www.google.com/',
+    'Sec-Fetch-Site': 'cross-site',
+}
+
+
+# Member-only indicators, most common first. Literal markers are found with
+# plain substring search, which is far cheaper than a case-insensitive regex
+# over the whole page; only the free-form "locked ... preview" text needs re
+_MEMBER_LITERALS = (
+    'isMarkedPaywallOnly',
+    'isLockedPreviewOnly',
+    'paywall',
+    'Paywall',
+    'member-only',
+    'Member-only',
+    'member only',
+    'Member only',
+)
+_LOCKED_PREVIEW_RE = re.compile(r'locked[^<]{0,50}preview', re.I)
+
+# Pages larger than this are complete articles; member-only markers found in
+# them are false positives (e.g. a paywall flag set to false in page JSON)
+_COMPLETE_PAGE_SIZE = 200000
+
+# Charset declared in a Content-Type header
+_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.I)
+
+
+# On-disk HTTP response cache (used when requests-cache is installed)
+HTTP_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.medium-reader', 'http_cache')
+HTTP_CACHE_EXPIRE_AFTER = 86400
+
 
 # Global session for cookie persistence
 _session: Optional[requests.Session] = None
 
+# Global aiohttp session for fetch_article_async, bound to the event loop
+# it was created in
+_aio_session = None
+_aio_session_loop: Optional[asyncio.AbstractEventLoop] = None
+# Homepage visit shared by every fetch on the current aiohttp session
+_aio_prime_task: Optional[asyncio.Task] = None
+
 
 def get_session() -> requests.Session:
     """Get or create a persistent session for cookie handling.
@@ -40,31 +119,81 @@ def get_session() -> requests.Session:
     """
     global _session
     if _session is None:
-        _session = requests.Session()
+        if requests_cache is not None:
+            # Repeat fetches within HTTP_CACHE_EXPIRE_AFTER are read from
+            # disk. Response Cache-Control headers are ignored on purpose:
+            # article pages are sent with no-cache/max-age=0 and would
+            # otherwise never be reused
+            _session = requests_cache.CachedSession(
+                cache_name=HTTP_CACHE_PATH,
+                backend='sqlite',
+                expire_after=HTTP_CACHE_EXPIRE_AFTER,
+                stale_if_error=True,
+                cache_control=False,
+            )
+        else:
+            _session = requests.Session()
         _session.headers.update(DEFAULT_HEADERS)
+        _session.headers['Accept-Encoding'] = _SUPPORTED_ACCEPT_ENCODING
+        logger.debug(f"Accept-Encoding: {_SUPPORTED_ACCEPT_ENCODING}")
+        
+        # Size the connection pool explicitly and retry transient failures
+        # with backoff instead of failing on the first error
+        retry = Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET'],
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=retry)
+        _session.mount('https://', adapter)
+        _session.mount('http://', adapter)
     return _session
 
 
-def get_headers_with_referrer(url: str) -> dict:
-    """Get headers with appropriate referrer for the request.
+def _cache_disabled(session: requests.Session):
+    """Get a context manager that bypasses the session's HTTP cache, if any.
     
     Args:
-        url: Target URL
+        session: Session returned by get_session()
         
     Returns:
-        dict: Headers dictionary with referrer
+        Context manager to wrap uncached requests in
     """
-    headers = DEFAULT_HEADERS.copy()
+    if hasattr(session, 'cache_disabled'):
+        return session.cache_disabled()
+    return contextlib.nullcontext()
+
+
+def is_medium_url(url: str) -> bool:
+    """Check whether a URL points at medium.com or one of its subdomains.
     
-    # Add referrer - if it's a Medium article, referrer should be medium.com
-    if 'medium.com' in url:
-        headers['Referer'] = 'https://medium.com/'
-        headers['Sec-Fetch-Site'] = 'same-origin'
-    else:
-        headers['Referer'] = 'https://www.google.com/'
-        headers['Sec-Fetch-Site'] = 'cross-site'
+    Args:
+        url: URL to check
+        
+    Returns:
+        bool: True if the URL's host is a Medium host
+    """
+    host = urlparse(url).hostname or ''
+    return host == 'medium.com' or host.endswith('.medium.com')
+
+
+def _referrer_headers_for(is_medium: bool) -> dict:
+    """Get the referrer headers to send on top of the session defaults.
+    
+    The returned dictionary is shared between calls and must not be modified.
     
-    return headers
+    Args:
+        is_medium: Whether the request goes to a Medium host
+        
+    Returns:
+        dict: Referer and Sec-Fetch-Site headers for the request
+    """
+    # Add referrer - if it's a Medium article, referrer should be medium.com
+    if is_medium:
+        return _HEADERS_MEDIUM
+    return _HEADERS_EXTERNAL
 
 
 class FetchError(Exception):
@@ -72,6 +201,43 @@ class FetchError(Exception):
     pass
 
 
+def _charset_from_content_type(content_type: str) -> str:
+    """Get the charset to decode a response with.
+    
+    Medium and freedium serve UTF-8, so UTF-8 is assumed unless the
+    Content-Type header names a known charset. This avoids both requests'
+    ISO-8859-1 default for text/* and a charset detection pass over the body.
+    
+    Args:
+        content_type: Value of the Content-Type response header
+        
+    Returns:
+        str: Codec name to decode the body with
+    """
+    match = _CHARSET_RE.search(content_type or '')
+    if match:
+        try:
+            return codecs.lookup(match.group(1)).name
+        except LookupError:
+            pass
+    return 'utf-8'
+
+
+def _has_member_marker(text: str) -> bool:
+    """Check text for member-only indicators.
+    
+    Args:
+        text: HTML or visible text
+        
+    Returns:
+        bool: True if a member-only indicator was found
+    """
+    for literal in _MEMBER_LITERALS:
+        if literal in text:
+            return True
+    return _LOCKED_PREVIEW_RE.search(text) is not None
+
+
 def _is_member_only_article(html: str) -> bool:
     """Check if the article is a member-only article.
     
@@ -81,33 +247,39 @@ def _is_member_only_article(html: str) -> bool:
     Returns:
         bool: True if article appears to be member-only
     """
-    import re
-    from bs4 import BeautifulSoup
-    
     # Check for member-only indicators in HTML
-    member_indicators = [
-        r'member-only',
-        r'member only',
-        r'isMarkedPaywallOnly',
-        r'isLockedPreviewOnly',
-        r'paywall',
-        r'locked.*preview',
-    ]
+    if _has_member_marker(html):
+        return True
     
-    html_lower = html.lower()
-    for indicator in member_indicators:
-        if re.search(indicator, html_lower, re.I):
-            return True
+    return _looks_truncated(html)
+
+
+def _looks_truncated(html: str) -> bool:
+    """Check if the article content looks like a truncated preview.
+    
+    Args:
+        html: HTML content of the article
+        
+    Returns:
+        bool: True if the content appears to be cut off
+    """
+    # Full article pages are large; only short pages are worth parsing
+    # to look for a truncated preview
+    if len(html) > 50000:
+        return False
+    
+    try:
+        tree = lxml_html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return False
     
     # Check if content seems truncated (very short postBody)
-    soup = BeautifulSoup(html, 'lxml')
-    post_body = soup.find('div', {'data-testid': 'postBody'})
+    post_body = tree.xpath('//div[@data-testid="postBody"]')
     if post_body:
-        text_length = len(post_body.get_text())
+        text = post_body[0].xpath('string()')
         # If postBody is very short (< 2000 chars), might be truncated
-        if text_length < 2000:
+        if len(text) < 2000:
             # Check if it ends with ellipsis or seems cut off
-            text = post_body.get_text()
             if text.endswith('...') or '...' in text[-100:]:
                 return True
             # Also check if it seems incomplete (ends mid-sentence)
@@ -118,23 +290,45 @@ def _is_member_only_article(html: str) -> bool:
     # If no postBody found at all, might be member-only
     if not post_body:
         # Check if there's very little content overall
-        body = soup.find('body')
-        if body:
-            body_text = body.get_text()
-            # If body has less than 3000 chars of text, might be truncated
-            if len(body_text) < 3000:
-                # Check for member-only indicators in visible text
-                if re.search(r'member.*only|paywall|locked', body_text, re.I):
-                    return True
+        body_text = tree.xpath('string(//body)')
+        # If body has less than 3000 chars of text, might be truncated
+        if body_text and len(body_text) < 3000:
+            # Check for member-only indicators in visible text
+            if _has_member_marker(body_text):
+                return True
     
     return False
 
 
-def fetch_article(url: str, timeout: int = 30, use_freedium: bool = False, use_freedium_mirror: bool = False, debug: bool = False) -> str:
+def _fetch_endpoints(url: str, use_freedium: bool, use_freedium_mirror: bool) -> list:
+    """Build the ordered list of endpoints to try for an article.
+    
+    Args:
+        url: URL of the Medium article
+        use_freedium: If True, start with the freedium.cfd proxy
+        use_freedium_mirror: If True, only use the freedium-mirror.cfd proxy
+        
+    Returns:
+        list: (service, target_url) tuples; service is None for a direct fetch
+    """
+    endpoints = [
+        (None, url),
+        ('freedium.cfd', f"https://freedium.cfd/{url}"),
+        ('freedium-mirror.cfd', f"https://freedium-mirror.cfd/{url}"),
+    ]
+    if use_freedium_mirror:
+        return endpoints[2:]
+    if use_freedium:
+        return endpoints[1:]
+    return endpoints
+
+
+def fetch_article(url: str, timeout: int = 30, use_freedium: bool = False, use_freedium_mirror: bool = False, debug: bool = False, cache: bool = True) -> str:
     """Fetch the HTML content of a Medium article.
     
     Uses a persistent session to maintain cookies and improve success rate.
     For member-only articles, can use freedium.cfd proxy with fallback to freedium-mirror.cfd.
+    When requests-cache is installed, responses are cached on disk for a day.
     
     Args:
         url: URL of the Medium article
@@ -142,6 +336,7 @@ def fetch_article(url: str, timeout: int = 30, use_freedium: bool = False, use_f
         use_freedium: If True, use freedium.cfd proxy (for member-only articles)
         use_freedium_mirror: If True, use freedium-mirror.cfd proxy (fallback)
         debug: If True, enable debug logging
+        cache: If False, bypass the on-disk HTTP cache and always hit the network
         
     Returns:
         str: HTML content of the article
@@ -153,95 +348,263 @@ def fetch_article(url: str, timeout: int = 30, use_freedium: bool = False, use_f
         logging.getLogger().setLevel(logging.DEBUG)
     
     session = get_session()
+    logger.debug(f"Timeout: {timeout} seconds")
     
-    # Use freedium proxy if requested (primary or mirror)
-    if use_freedium or use_freedium_mirror:
-        if use_freedium_mirror:
-            freedium_url = f"https://freedium-mirror.cfd/{url}"
-            freedium_service = "freedium-mirror.cfd"
+    # Freedium proxies are never Medium hosts, so only the direct URL needs checking
+    is_medium = is_medium_url(url)
+    endpoints = _fetch_endpoints(url, use_freedium, use_freedium_mirror)
+    for index, (freedium_service, target_url) in enumerate(endpoints):
+        has_fallback = index < len(endpoints) - 1
+        headers = _referrer_headers_for(is_medium and not freedium_service)
+        if freedium_service:
+            logger.debug(f"Using freedium proxy ({freedium_service}): {target_url}")
         else:
-            freedium_url = f"https://freedium.cfd/{url}"
-            freedium_service = "freedium.cfd"
-        headers = get_headers_with_referrer(freedium_url)
-        logger.debug(f"Using freedium proxy ({freedium_service}): {freedium_url}")
-    else:
-        headers = get_headers_with_referrer(url)
-        freedium_url = None
-        freedium_service = None
-        logger.debug(f"Fetching directly from: {url}")
-    
-    logger.debug(f"Request headers: {headers}")
-    logger.debug(f"Timeout: {timeout} seconds")
+            logger.debug(f"Fetching directly from: {target_url}")
+        logger.debug(f"Request headers: {headers}")
+        
+        try:
+            # First, visit the Medium homepage to establish session and cookies
+            # (only if not using freedium and the session has no cookies yet)
+            if not freedium_service and len(session.cookies) == 0:
+                try:
+                    logger.debug("Visiting Medium homepage to establish session...")
+                    # Cached responses don't set cookies, so always go to the network
+                    with _cache_disabled(session):
+                        homepage_response = session.get('https://medium.com/', headers=headers, timeout=min(timeout, 5))
+                    logger.debug(f"Homepage response status: {homepage_response.status_code}")
+                    logger.debug(f"Session cookies: {dict(session.cookies)}")
+                except Exception as e:
+                    # If homepage visit fails, continue anyway
+                    logger.warning(f"Failed to visit homepage (continuing anyway): {e}")
+            
+            # Fetch the article (or from freedium proxy)
+            logger.debug(f"Fetching article from: {target_url}")
+            
+            use_cache = cache and hasattr(session, 'cache_disabled')
+            request_headers = headers
+            if use_cache:
+                # requests-cache treats the browser-like "Cache-Control:
+                # max-age=0" as "don't use the cache"; None drops the
+                # session default for this request
+                request_headers = {**headers, 'Cache-Control': None}
+            with contextlib.nullcontext() if use_cache else _cache_disabled(session):
+                response = session.get(
+                    target_url,
+                    headers=request_headers,
+                    timeout=timeout,
+                    allow_redirects=True
+                )
+            
+            logger.debug(f"Response status code: {response.status_code}")
+            logger.debug(f"Served from cache: {getattr(response, 'from_cache', False)}")
+            logger.debug(f"Response headers: {dict(response.headers)}")
+            logger.debug(f"Final URL after redirects: {response.url}")
+            logger.debug(f"Content-Encoding: {response.headers.get('Content-Encoding', 'identity')}")
+            
+            response.raise_for_status()
+            
+            content = response.content
+            logger.debug(f"Response content length: {len(content)} bytes")
+            encoding = _charset_from_content_type(response.headers.get('Content-Type'))
+            html = content.decode(encoding, errors='replace')
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            # If freedium.cfd fails to connect or times out, try the mirror
+            if freedium_service and has_fallback:
+                logger.warning(f"Connection error with {freedium_service}: {e}")
+                logger.info(f"Falling back to {endpoints[index + 1][0]}...")
+                continue
+            
+            # If we already tried the mirror or it's not a freedium request, raise the error
+            if isinstance(e, requests.exceptions.Timeout):
+                logger.error(f"Request timed out after {timeout} seconds")
+                logger.debug(f"Timeout exception: {e}", exc_info=True)
+                raise FetchError(f"Request timed out while fetching {url}")
+            logger.error(f"Connection error: {e}")
+            logger.debug(f"Connection error details: {type(e).__name__}: {e}", exc_info=True)
+            raise FetchError(f"Connection error while fetching {url}")
+        except requests.exceptions.HTTPError as e:
+            status_code = e.response.status_code if e.response is not None else 'unknown'
+            logger.error(f"HTTP error {status_code}")
+            if e.response is not None:
+                logger.debug(f"Response headers: {dict(e.response.headers)}")
+                logger.debug(f"Response content (first 500 chars): {e.response.text[:500]}")
+            logger.debug(f"HTTP error details: {e}", exc_info=True)
+            raise FetchError(f"HTTP error {status_code} while fetching {url}")
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request exception: {e}")
+            logger.debug(f"Request exception details: {type(e).__name__}: {e}", exc_info=True)
+            raise FetchError(f"Error fetching {url}: {str(e)}")
+        
+        logger.debug(f"HTML content length: {len(html)} characters")
+        
+        # If we fetched directly, check if article is member-only
+        # If so, move on to the freedium proxy. Pages past
+        # _COMPLETE_PAGE_SIZE decoded bytes are complete articles, so a
+        # marker in them is a false positive and isn't worth a freedium trip
+        if (not freedium_service and has_fallback and len(content) <= _COMPLETE_PAGE_SIZE
+                and _is_member_only_article(html)):
+            logger.info("Article appears to be member-only, retrying with freedium proxy...")
+            continue
+        
+        return html
+
+
+async def _get_aio_session():
+    """Get or create the aiohttp session for the running event loop.
     
+    Returns:
+        aiohttp.ClientSession: Session object with persistent cookies
+    """
+    global _aio_session, _aio_session_loop, _aio_prime_task
+    loop = asyncio.get_running_loop()
+    if _aio_session is None or _aio_session.closed or _aio_session_loop is not loop:
+        _aio_prime_task = None
+        connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+        headers = {**DEFAULT_HEADERS, 'Accept-Encoding': _AIOHTTP_ACCEPT_ENCODING}
+        _aio_session = aiohttp.ClientSession(headers=headers, connector=connector)
+        _aio_session_loop = loop
+    return _aio_session
+
+
+async def close_async_session() -> None:
+    """Close the aiohttp session used by fetch_article_async, if any."""
+    global _aio_session, _aio_session_loop, _aio_prime_task
+    if _aio_session is not None and not _aio_session.closed:
+        await _aio_session.close()
+    _aio_session = None
+    _aio_session_loop = None
+    _aio_prime_task = None
+
+
+async def _prime_aio_session(session, headers: dict, timeout: int) -> None:
+    """Visit the Medium homepage to establish cookies, ignoring failures.
+    
+    Args:
+        session: aiohttp session to prime
+        headers: Request headers
+        timeout: Request timeout in seconds
+    """
     try:
-        # First, visit the Medium homepage to establish session and cookies
-        # (only if not using freedium)
-        if not use_freedium and not use_freedium_mirror:
-            try:
-                logger.debug("Visiting Medium homepage to establish session...")
-                homepage_response = session.get('https://medium.com/', headers=headers, timeout=timeout)
-                logger.debug(f"Homepage response status: {homepage_response.status_code}")
-                logger.debug(f"Session cookies: {dict(session.cookies)}")
-            except Exception as e:
-                # If homepage visit fails, continue anyway
-                logger.warning(f"Failed to visit homepage (continuing anyway): {e}")
-                pass
-        
-        # Fetch the article (or from freedium proxy)
-        target_url = freedium_url if freedium_url else url
-        logger.debug(f"Fetching article from: {target_url}")
+        logger.debug("Visiting Medium homepage to establish session...")
+        async with session.get('https://medium.com/', headers=headers,
+                               timeout=aiohttp.ClientTimeout(total=min(timeout, 5))) as homepage_response:
+            logger.debug(f"Homepage response status: {homepage_response.status}")
+    except Exception as e:
+        # If homepage visit fails, continue anyway
+        logger.warning(f"Failed to visit homepage (continuing anyway): {e}")
+
+
+async def _ensure_aio_session_primed(session, headers: dict, timeout: int) -> None:
+    """Wait for the session's homepage visit, starting it on first use.
+    
+    Concurrent fetches on a fresh session share a single homepage request
+    instead of each sending their own.
+    
+    Args:
+        session: aiohttp session to prime
+        headers: Request headers
+        timeout: Request timeout in seconds
+    """
+    global _aio_prime_task
+    if _aio_prime_task is None:
+        _aio_prime_task = asyncio.ensure_future(_prime_aio_session(session, headers, timeout))
+    prime_task = _aio_prime_task
+    # Shield the shared task so one cancelled fetch doesn't cancel it for all
+    await asyncio.shield(prime_task)
+    
+    # A visit that left no cookies (e.g. it failed) is retried by the next
+    # fetch, like the synchronous path does
+    if len(session.cookie_jar) == 0 and _aio_prime_task is prime_task:
+        _aio_prime_task = None
+
+
+async def _read_aio_response(session, target_url: str, headers: dict, timeout: int, url: str) -> Tuple[bytes, str]:
+    """Fetch a page with aiohttp and read its body.
+    
+    Args:
+        session: aiohttp session to use
+        target_url: URL to request
+        headers: Request headers
+        timeout: Request timeout in seconds
+        url: Original article URL, for error messages
         
-        response = session.get(
-            target_url,
-            headers=headers,
-            timeout=timeout,
-            allow_redirects=True
-        )
+    Returns:
+        tuple: Decoded (uncompressed) body bytes and the charset to decode them with
         
-        logger.debug(f"Response status code: {response.status_code}")
-        logger.debug(f"Response headers: {dict(response.headers)}")
-        logger.debug(f"Final URL after redirects: {response.url}")
-        logger.debug(f"Response content length: {len(response.content)} bytes")
+    Raises:
+        FetchError: If the server responds with an HTTP error status
+    """
+    async with session.get(target_url, headers=headers,
+                           timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+        logger.debug(f"Response status code: {response.status}")
+        if response.status >= 400:
+            logger.error(f"HTTP error {response.status}")
+            raise FetchError(f"HTTP error {response.status} while fetching {url}")
+        encoding = _charset_from_content_type(response.headers.get('Content-Type'))
+        return await response.read(), encoding
+
+
+async def fetch_article_async(url: str, timeout: int = 30, use_freedium: bool = False, use_freedium_mirror: bool = False) -> str:
+    """Fetch the HTML content of a Medium article without blocking the event loop.
+    
+    Asynchronous counterpart of fetch_article, so several articles can be
+    fetched concurrently with asyncio.gather(). Requires aiohttp.
+    
+    Args:
+        url: URL of the Medium article
+        timeout: Request timeout in seconds
+        use_freedium: If True, use freedium.cfd proxy (for member-only articles)
+        use_freedium_mirror: If True, use freedium-mirror.cfd proxy (fallback)
         
-        response.raise_for_status()
-        html = response.text
+    Returns:
+        str: HTML content of the article
         
-        logger.debug(f"HTML content length: {len(html)} characters")
+    Raises:
+        FetchError: If the article cannot be fetched
+    """
+    if aiohttp is None:
+        raise FetchError("fetch_article_async requires aiohttp (pip install 'medium-reader[async]')")
+    
+    session = await _get_aio_session()
+    
+    is_medium = is_medium_url(url)
+    endpoints = _fetch_endpoints(url, use_freedium, use_freedium_mirror)
+    for index, (freedium_service, target_url) in enumerate(endpoints):
+        has_fallback = index < len(endpoints) - 1
+        headers = _referrer_headers_for(is_medium and not freedium_service)
+        logger.debug(f"Fetching article from: {target_url}")
         
-        # If we didn't use freedium, check if article is member-only
-        # If so, retry with freedium
-        if not use_freedium and not use_freedium_mirror and _is_member_only_article(html):
+        try:
+            # First, visit the Medium homepage to establish cookies (only if
+            # not using freedium and the session has no cookies yet)
+            if not freedium_service and len(session.cookie_jar) == 0:
+                await _ensure_aio_session_primed(session, headers, timeout)
+            content, encoding = await _read_aio_response(session, target_url, headers, timeout, url)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            # If freedium.cfd fails to connect or times out, try the mirror
+            if freedium_service and has_fallback:
+                logger.warning(f"Connection error with {freedium_service}: {e}")
+                logger.info(f"Falling back to {endpoints[index + 1][0]}...")
+                continue
+            
+            if isinstance(e, asyncio.TimeoutError):
+                logger.error(f"Request timed out after {timeout} seconds")
+                raise FetchError(f"Request timed out while fetching {url}")
+            logger.error(f"Connection error: {e}")
+            raise FetchError(f"Connection error while fetching {url}")
+        except aiohttp.ClientError as e:
+            logger.error(f"Request exception: {e}")
+            raise FetchError(f"Error fetching {url}: {str(e)}")
+        
+        logger.debug(f"Response content length: {len(content)} bytes")
+        html = content.decode(encoding, errors='replace')
+        
+        # If we fetched directly, check if article is member-only
+        # If so, move on to the freedium proxy; like fetch_article, the
+        # complete-page threshold applies to the decoded body in bytes
+        if (not freedium_service and has_fallback and len(content) <= _COMPLETE_PAGE_SIZE
+                and _is_member_only_article(html)):
             logger.info("Article appears to be member-only, retrying with freedium proxy...")
-            # Retry with freedium proxy
-            return fetch_article(url, timeout, use_freedium=True, debug=debug)
+            continue
         
         return html
-    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
-        # If we're using freedium.cfd and get a connection/timeout error, try the mirror
-        if use_freedium and not use_freedium_mirror:
-            logger.warning(f"Connection error with freedium.cfd: {e}")
-            logger.info("Falling back to freedium-mirror.cfd...")
-            return fetch_article(url, timeout, use_freedium=False, use_freedium_mirror=True, debug=debug)
-        
-        # If we already tried the mirror or it's not a freedium request, raise the error
-        if isinstance(e, requests.exceptions.Timeout):
-            logger.error(f"Request timed out after {timeout} seconds")
-            logger.debug(f"Timeout exception: {e}", exc_info=True)
-            raise FetchError(f"Request timed out while fetching {url}")
-        else:
-            logger.error(f"Connection error: {e}")
-            logger.debug(f"Connection error details: {type(e).__name__}: {e}", exc_info=True)
-            raise FetchError(f"Connection error while fetching {url}")
-    except requests.exceptions.HTTPError as e:
-        status_code = e.response.status_code if e.response else 'unknown'
-        logger.error(f"HTTP error {status_code}")
-        if e.response:
-            logger.debug(f"Response headers: {dict(e.response.headers)}")
-            logger.debug(f"Response content (first 500 chars): {e.response.text[:500]}")
-        logger.debug(f"HTTP error details: {e}", exc_info=True)
-        raise FetchError(f"HTTP error {status_code} while fetching {url}")
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Request exception: {e}")
-        logger.debug(f"Request exception details: {type(e).__name__}: {e}", exc_info=True)
-        raise FetchError(f"Error fetching {url}: {str(e)}")
-
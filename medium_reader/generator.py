@@ -1,24 +1,31 @@
 """HTML file generation from parsed article content."""
 
+import html as html_lib
+from datetime import datetime
+from functools import lru_cache
 from typing import Optional
-from bs4 import BeautifulSoup
-from .parser import ArticleData
+from lxml import etree, html as lxml_html
+from .parser import ArticleData, ParseError, _parse_html
 
 
-HTML_TEMPLATE = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <style>
-        * {{
+# Escapes for text and attribute values interpolated into the document
+_HTML_ESCAPE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#39;',
+})
+
+# Static stylesheet, kept out of any formatting path so braces need no escaping
+HTML_STYLE = """<style>
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
             line-height: 1.6;
             color: #333;
@@ -26,177 +33,199 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             max-width: 800px;
             margin: 0 auto;
             padding: 20px;
-        }}
+        }
         
-        .article-header {{
+        .article-header {
             margin-bottom: 40px;
             padding-bottom: 20px;
             border-bottom: 1px solid #e0e0e0;
-        }}
+        }
         
-        .article-title {{
+        .article-title {
             font-size: 2.5em;
             font-weight: 700;
             margin-bottom: 15px;
             color: #000;
             line-height: 1.2;
-        }}
+        }
         
-        .article-meta {{
+        .article-meta {
             color: #666;
             font-size: 0.95em;
             margin-bottom: 20px;
-        }}
+        }
         
-        .article-author {{
+        .article-author {
             font-weight: 500;
             color: #333;
-        }}
+        }
         
-        .article-date {{
+        .article-date {
             margin-top: 5px;
             color: #999;
-        }}
+        }
         
-        .article-image {{
+        .article-image {
             width: 100%;
             max-width: 100%;
             height: auto;
             margin: 30px 0;
             border-radius: 4px;
-        }}
+        }
         
-        .article-description {{
+        .article-description {
             font-size: 1.2em;
             color: #666;
             font-style: italic;
             margin-bottom: 30px;
             line-height: 1.5;
-        }}
+        }
         
-        .article-body {{
+        .article-body {
             font-size: 1.1em;
             line-height: 1.8;
-        }}
+        }
         
-        .article-body p {{
+        .article-body p {
             margin-bottom: 20px;
-        }}
+        }
         
         .article-body h1,
         .article-body h2,
         .article-body h3,
-        .article-body h4 {{
+        .article-body h4 {
             margin-top: 40px;
             margin-bottom: 20px;
             font-weight: 700;
             line-height: 1.3;
-        }}
+        }
         
-        .article-body h1 {{
+        .article-body h1 {
             font-size: 2em;
-        }}
+        }
         
-        .article-body h2 {{
+        .article-body h2 {
             font-size: 1.75em;
-        }}
+        }
         
-        .article-body h3 {{
+        .article-body h3 {
             font-size: 1.5em;
-        }}
+        }
         
-        .article-body h4 {{
+        .article-body h4 {
             font-size: 1.25em;
-        }}
+        }
         
-        .article-body img {{
+        .article-body img {
             max-width: 100%;
             height: auto;
             margin: 30px 0;
             border-radius: 4px;
-        }}
+        }
         
-        .article-body a {{
+        .article-body a {
             color: #007bff;
             text-decoration: none;
-        }}
+        }
         
-        .article-body a:hover {{
+        .article-body a:hover {
             text-decoration: underline;
-        }}
+        }
         
-        .article-body blockquote {{
+        .article-body blockquote {
             border-left: 4px solid #ddd;
             padding-left: 20px;
             margin: 30px 0;
             color: #666;
             font-style: italic;
-        }}
+        }
         
-        .article-body code {{
+        .article-body code {
             background-color: #f4f4f4;
             padding: 2px 6px;
             border-radius: 3px;
             font-family: 'Courier New', monospace;
             font-size: 0.9em;
-        }}
+        }
         
-        .article-body pre {{
+        .article-body pre {
             background-color: #f4f4f4;
             padding: 20px;
             border-radius: 4px;
             overflow-x: auto;
             margin: 30px 0;
-        }}
+        }
         
-        .article-body pre code {{
+        .article-body pre code {
             background-color: transparent;
             padding: 0;
-        }}
+        }
         
         .article-body ul,
-        .article-body ol {{
+        .article-body ol {
             margin: 20px 0;
             padding-left: 40px;
-        }}
+        }
         
-        .article-body li {{
+        .article-body li {
             margin-bottom: 10px;
-        }}
+        }
         
-        @media (max-width: 768px) {{
-            body {{
+        @media (max-width: 768px) {
+            body {
                 padding: 15px;
-            }}
+            }
             
-            .article-title {{
+            .article-title {
                 font-size: 2em;
-            }}
+            }
             
-            .article-body {{
+            .article-body {
                 font-size: 1em;
-            }}
-        }}
-    </style>
+            }
+        }
+    </style>"""
+
+# Static document fragments surrounding the per-article fields
+_HTML_HEAD_OPEN = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>"""
+
+_HTML_HEADER_OPEN = """</title>
+    """ + HTML_STYLE + """
 </head>
 <body>
     <article>
         <header class="article-header">
-            <h1 class="article-title">{title}</h1>
+            <h1 class="article-title">"""
+
+_HTML_META_OPEN = """</h1>
             <div class="article-meta">
-                {meta}
+                """
+
+_HTML_META_CLOSE = """
             </div>
-            {image}
-            {description}
+            """
+
+_HTML_HEADER_SEP = """
+            """
+
+_HTML_BODY_OPEN = """
         </header>
         <div class="article-body">
-            {body}
+            """
+
+_HTML_DOC_CLOSE = """
         </div>
     </article>
 </body>
 </html>"""
 
 
+@lru_cache(maxsize=1024)
 def format_date(date_string: Optional[str]) -> str:
     """Format a date string for display.
     
@@ -210,7 +239,6 @@ def format_date(date_string: Optional[str]) -> str:
         return ""
     
     try:
-        from datetime import datetime
         dt = datetime.fromisoformat(date_string.replace('Z', '+00:00'))
         return dt.strftime('%B %d, %Y')
     except (ValueError, AttributeError):
@@ -234,31 +262,34 @@ def clean_html_body(body: str) -> str:
         paragraphs = [p.strip() for p in body.split('\n\n') if p.strip()]
         return '\n'.join(f'<p>{p}</p>' for p in paragraphs)
     
-    # Parse and clean HTML
-    soup = BeautifulSoup(body, 'lxml')
-    
-    # Remove nested html/body tags
-    for nested in soup.find_all(['html', 'body']):
-        nested.unwrap()
+    # Parse and clean HTML; nested html/body tags are folded into the
+    # document's own body by the parser
+    try:
+        root = _parse_html(body)
+    except ParseError:
+        return ""
+    content = root.find('body')
+    if content is None:
+        return ""
     
     # Remove script and style tags
-    for script in soup(['script', 'style']):
-        script.decompose()
+    etree.strip_elements(content, 'script', 'style', with_tail=False)
     
     # Ensure images have proper attributes
-    for img in soup.find_all('img'):
-        if not img.get('src'):
-            img.decompose()
-        else:
-            img['loading'] = 'lazy'
+    for img in content.xpath('.//img[not(@src) or @src=""]'):
+        img.drop_tree()
+    for img in content.iter('img'):
+        img.set('loading', 'lazy')
     
     # Return the content - if there's a single top-level div, return it
-    # Otherwise return the whole soup content
-    top_level = [elem for elem in soup.children if hasattr(elem, 'name') and elem.name]
-    if len(top_level) == 1 and top_level[0].name == 'div':
-        return str(top_level[0])
+    # Otherwise return the whole body content
+    top_level = [elem for elem in content if isinstance(elem.tag, str)]
+    if len(top_level) == 1 and top_level[0].tag == 'div':
+        return lxml_html.tostring(top_level[0], encoding='unicode', with_tail=False)
     
-    return str(soup)
+    parts = [html_lib.escape(content.text, quote=False)] if content.text else []
+    parts.extend(lxml_html.tostring(child, encoding='unicode') for child in content)
+    return ''.join(parts)
 
 
 def generate_html(article: ArticleData) -> str:
@@ -270,13 +301,17 @@ def generate_html(article: ArticleData) -> str:
     Returns:
         str: Complete HTML document
     """
+    title = (article.title or 'Article').translate(_HTML_ESCAPE)
+    
     # Build meta information
     meta_parts = []
     if article.author:
-        meta_parts.append(f'<span class="article-author">By {article.author}</span>')
+        author = article.author.translate(_HTML_ESCAPE)
+        meta_parts.append(f'<span class="article-author">By {author}</span>')
     if article.publication_date:
         formatted_date = format_date(article.publication_date)
         if formatted_date:
+            formatted_date = formatted_date.translate(_HTML_ESCAPE)
             meta_parts.append(f'<div class="article-date">{formatted_date}</div>')
     
     meta = '\n                '.join(meta_parts) if meta_parts else ''
@@ -284,23 +319,22 @@ def generate_html(article: ArticleData) -> str:
     # Build image HTML
     image_html = ''
     if article.image:
-        image_html = f'<img src="{article.image}" alt="{article.title}" class="article-image">'
+        image = article.image.translate(_HTML_ESCAPE)
+        image_html = f'<img src="{image}" alt="{title}" class="article-image">'
     
     # Build description HTML
     description_html = ''
     if article.description:
-        description_html = f'<div class="article-description">{article.description}</div>'
+        description = article.description.translate(_HTML_ESCAPE)
+        description_html = f'<div class="article-description">{description}</div>'
     
     # Clean and process body
     body_html = clean_html_body(article.body)
     
-    # Fill template
-    html = HTML_TEMPLATE.format(
-        title=article.title or 'Article',
-        meta=meta,
-        image=image_html,
-        description=description_html,
-        body=body_html
+    # Assemble the document from the static fragments in one f-string
+    return (
+        f'{_HTML_HEAD_OPEN}{title}{_HTML_HEADER_OPEN}{title}'
+        f'{_HTML_META_OPEN}{meta}{_HTML_META_CLOSE}'
+        f'{image_html}{_HTML_HEADER_SEP}{description_html}'
+        f'{_HTML_BODY_OPEN}{body_html}{_HTML_DOC_CLOSE}'
     )
-    
-    return html
@@ -1,9 +1,45 @@
 """HTML/JSON parsing and content extraction from Medium articles."""
 
+import copy
 import json
+import os
 import re
-from typing import Optional, Dict, Any
-from bs4 import BeautifulSoup
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, Any, Iterable, List
+from urllib.parse import urlparse
+from lxml import etree, html as lxml_html
+
+try:
+    import orjson
+except ImportError:  # optional, faster JSON-LD decoding
+    orjson = None
+
+# Both decoders raise a ValueError subclass on malformed input
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# JSON-LD script bodies as plain str (orjson rejects lxml's smart-string subclass)
+_JSON_LD_XPATH = etree.XPath('//script[@type="application/ld+json"]/text()', smart_strings=False)
+
+# UI text and link targets, matched against lowercased text in one pass each
+_UI_TEXT_RE = re.compile(r'sign in|sign up|clap|bookmark|share|follow|member-only|responses|min read')
+_UI_HREF_RE = re.compile(r'/m/signin|bookmark|clap')
+
+# " - Freedium" or " | Freedium" title suffix added by freedium.cfd
+_FREEDIUM_SUFFIX_RE = re.compile(r'\s*[-|]\s*Freedium\s*$', re.I)
+
+# Classed divs/spans that look like UI chrome (button, icon, tooltip, menu or
+# nav in a case-insensitive class) and hold no media or code, filtered in C;
+# whether they are empty is left to str.strip(), which XPath can't match
+_UI_CLASS_NAMES = ('button', 'icon', 'tooltip', 'menu', 'nav')
+_LOWER_CLASS = 'translate(@class, "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")'
+_UI_STYLED_XPATH = etree.XPath(
+    './/*[self::div or self::span][@class]'
+    '[not(.//img or .//figure or .//pre or .//code)]'
+    '[' + ' or '.join(f'contains({_LOWER_CLASS}, "{name}")' for name in _UI_CLASS_NAMES) + ']'
+)
+
+# Fallback parser for documents lxml won't take as str (XML encoding declaration)
+_UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
 
 
 class ParseError(Exception):
@@ -23,28 +59,139 @@ class ArticleData:
         self.image: Optional[str] = None
 
 
-def extract_json_ld(html: str) -> list:
-    """Extract JSON-LD structured data from HTML.
+class ArticleBatch:
+    """Column-oriented container for many parsed articles.
+    
+    Each ArticleData field is kept in its own list; position i in every
+    list belongs to the i-th article.
+    """
+    
+    def __init__(self):
+        self.titles: List[Optional[str]] = []
+        self.authors: List[Optional[str]] = []
+        self.publication_dates: List[Optional[str]] = []
+        self.bodies: List[Optional[str]] = []
+        self.descriptions: List[Optional[str]] = []
+        self.images: List[Optional[str]] = []
+    
+    def __len__(self) -> int:
+        return len(self.titles)
+    
+    def __getitem__(self, index: int) -> ArticleData:
+        """Rebuild a single article from the columns.
+        
+        Args:
+            index: Position of the article in the batch
+            
+        Returns:
+            ArticleData: The article at that position
+        """
+        article = ArticleData()
+        article.title = self.titles[index]
+        article.author = self.authors[index]
+        article.publication_date = self.publication_dates[index]
+        article.body = self.bodies[index]
+        article.description = self.descriptions[index]
+        article.image = self.images[index]
+        return article
+    
+    def append(self, article: ArticleData) -> None:
+        """Add a parsed article to the end of the batch.
+        
+        Args:
+            article: ArticleData to add
+        """
+        self.titles.append(article.title)
+        self.authors.append(article.author)
+        self.publication_dates.append(article.publication_date)
+        self.bodies.append(article.body)
+        self.descriptions.append(article.description)
+        self.images.append(article.image)
+
+
+def _parse_html(html: str):
+    """Parse an HTML document with lxml.
     
     Args:
         html: HTML content
         
+    Returns:
+        lxml.html.HtmlElement: Root element of the document
+        
+    Raises:
+        ParseError: If the HTML cannot be parsed
+    """
+    try:
+        return lxml_html.document_fromstring(html)
+    except ValueError:
+        # lxml rejects str input that carries an XML encoding declaration
+        return lxml_html.document_fromstring(html.encode('utf-8'), parser=_UTF8_HTML_PARSER)
+    except etree.ParserError as e:
+        raise ParseError(f"Could not parse HTML: {e}")
+
+
+def _text(elem) -> str:
+    """Get the text of an element, skipping script and style contents.
+    
+    Args:
+        elem: lxml element
+        
+    Returns:
+        str: Concatenated text of the element's descendants
+    """
+    return ''.join(elem.xpath('.//text()[not(ancestor::script or ancestor::style)]'))
+
+
+def _to_html(elem) -> str:
+    """Serialize an lxml element (without its tail) to an HTML string.
+    
+    Args:
+        elem: lxml element
+        
+    Returns:
+        str: HTML markup of the element
+    """
+    return lxml_html.tostring(elem, encoding='unicode', with_tail=False)
+
+
+def _copy_element(elem):
+    """Make an independent copy of an lxml element for cleaning.
+    
+    Args:
+        elem: lxml element
+        
+    Returns:
+        lxml element: Deep copy of elem, detached from its document
+    """
+    copied = copy.deepcopy(elem)
+    copied.tail = None
+    return copied
+
+
+def extract_json_ld(tree) -> list:
+    """Extract JSON-LD structured data from HTML.
+    
+    Args:
+        tree: Parsed HTML document (lxml element)
+        
     Returns:
         list: List of parsed JSON-LD objects
     """
-    soup = BeautifulSoup(html, 'lxml')
     json_ld_data = []
     
-    scripts = soup.find_all('script', type='application/ld+json')
+    scripts = _JSON_LD_XPATH(tree)
     for script in scripts:
+        # Skip blank scripts up front rather than letting the decoder raise
+        if not script or script.isspace():
+            continue
         try:
-            data = json.loads(script.string)
-            if isinstance(data, list):
-                json_ld_data.extend(data)
-            else:
-                json_ld_data.append(data)
-        except (json.JSONDecodeError, AttributeError):
+            data = _json_loads(script)
+        except ValueError:
             continue
+        if isinstance(data, list):
+            json_ld_data.extend(data)
+        else:
+            json_ld_data.append(data)
     
     return json_ld_data
 
@@ -58,57 +205,80 @@ def extract_article_from_json_ld(json_ld_data: list) -> Optional[Dict[str, Any]]
     Returns:
         dict: Article data if found, None otherwise
     """
+    # Index objects by type once, keeping the first object of each type
+    by_type = {}
     for data in json_ld_data:
         if isinstance(data, dict):
-            if data.get('@type') in ['Article', 'BlogPosting']:
-                return data
-            if 'article' in data.get('@type', '').lower():
-                return data
+            type_name = data.get('@type')
+            if isinstance(type_name, str):
+                by_type.setdefault(type_name, data)
+    
+    article = by_type.get('Article') or by_type.get('BlogPosting')
+    if article is not None:
+        return article
+    
+    # Fall back to any article subtype (NewsArticle, TechArticle, ...)
+    for type_name, data in by_type.items():
+        if 'article' in type_name.lower():
+            return data
     return None
 
 
-def extract_article_from_meta_tags(html: str) -> Dict[str, Optional[str]]:
+def _meta_content(tree, xpath: str) -> Optional[str]:
+    """Get the content attribute of the first matching meta tag.
+    
+    Args:
+        tree: Parsed HTML document (lxml element)
+        xpath: XPath selecting meta elements
+        
+    Returns:
+        str: Attribute value, or None if missing or empty
+    """
+    for meta in tree.xpath(xpath):
+        return meta.get('content') or None
+    return None
+
+
+def extract_article_from_meta_tags(tree) -> Dict[str, Optional[str]]:
     """Extract article metadata from meta tags.
     
     Args:
-        html: HTML content
+        tree: Parsed HTML document (lxml element)
         
     Returns:
         dict: Dictionary with title, author, description, etc.
     """
-    soup = BeautifulSoup(html, 'lxml')
     meta_data = {}
     
     # Extract title - try Open Graph first
-    og_title = soup.find('meta', property='og:title')
-    if og_title and og_title.get('content'):
-        title = og_title['content'].strip()
+    og_title = _meta_content(tree, '//meta[@property="og:title"]')
+    if og_title:
+        title = og_title.strip()
         if title and title.lower() != 'medium':
             meta_data['title'] = title
     
     # Try Twitter card title
     if not meta_data.get('title'):
-        twitter_title = soup.find('meta', {'name': 'twitter:title'})
-        if twitter_title and twitter_title.get('content'):
-            title = twitter_title['content'].strip()
+        twitter_title = _meta_content(tree, '//meta[@name="twitter:title"]')
+        if twitter_title:
+            title = twitter_title.strip()
             if title and title.lower() != 'medium':
                 meta_data['title'] = title
     
     # Try h1 with article-related attributes
     if not meta_data.get('title'):
-        h1_tags = soup.find_all('h1')
-        for h1 in h1_tags:
-            text = h1.get_text().strip()
+        for h1 in tree.iter('h1'):
+            text = _text(h1).strip()
             if (text and len(text) > 5 and text.lower() != 'medium' and
-                (h1.get('data-testid') or 'postTitle' in str(h1.get('class', [])))):
+                (h1.get('data-testid') or 'postTitle' in (h1.get('class') or ''))):
                 meta_data['title'] = text
                 break
     
     # Fallback to title tag
     if not meta_data.get('title'):
-        title_tag = soup.find('title')
-        if title_tag:
-            title = title_tag.get_text().strip()
+        title_tag = next(tree.iter('title'), None)
+        if title_tag is not None:
+            title = _text(title_tag).strip()
             if title and title.lower() != 'medium' and len(title) > 5:
                 meta_data['title'] = title
     
@@ -116,27 +286,27 @@ def extract_article_from_meta_tags(html: str) -> Dict[str, Optional[str]]:
     if meta_data.get('title'):
         title = meta_data['title']
         # Remove " - Freedium" or " | Freedium" suffixes
-        title = re.sub(r'\s*[-|]\s*Freedium\s*$', '', title, flags=re.I)
+        title = _FREEDIUM_SUFFIX_RE.sub('', title)
         meta_data['title'] = title.strip()
     
     # Extract author
-    author_tag = soup.find('meta', {'name': 'author'})
-    if author_tag and author_tag.get('content'):
-        meta_data['author'] = author_tag['content']
+    author = _meta_content(tree, '//meta[@name="author"]')
+    if author:
+        meta_data['author'] = author
     
-    author_link = soup.find('link', rel='author')
-    if author_link and author_link.get('title'):
-        meta_data['author'] = author_link['title']
+    author_links = tree.xpath('//link[contains(concat(" ", normalize-space(@rel), " "), " author ")]')
+    if author_links and author_links[0].get('title'):
+        meta_data['author'] = author_links[0].get('title')
     
     # Extract description
-    desc_tag = soup.find('meta', property='og:description')
-    if desc_tag and desc_tag.get('content'):
-        meta_data['description'] = desc_tag['content']
+    description = _meta_content(tree, '//meta[@property="og:description"]')
+    if description:
+        meta_data['description'] = description
     
     # Extract image
-    img_tag = soup.find('meta', property='og:image')
-    if img_tag and img_tag.get('content'):
-        meta_data['image'] = img_tag['content']
+    image = _meta_content(tree, '//meta[@property="og:image"]')
+    if image:
+        meta_data['image'] = image
     
     return meta_data
 
@@ -145,124 +315,129 @@ def _is_ui_element(elem) -> bool:
     """Check if an element is a UI element that should be removed.
     
     Args:
-        elem: BeautifulSoup element
+        elem: lxml element
         
     Returns:
         bool: True if element is UI-related
     """
-    if not hasattr(elem, 'get_text'):
-        return False
-    
-    text = elem.get_text().strip().lower()
-    ui_keywords = ['sign in', 'sign up', 'clap', 'bookmark', 'share', 'follow', 
-                   'member-only', 'responses', 'min read']
-    
-    if any(keyword in text for keyword in ui_keywords):
+    text = _text(elem).strip().lower()
+    if _UI_TEXT_RE.search(text):
         return True
     
     # Check href for UI links
-    if elem.name == 'a':
+    if elem.tag == 'a':
         href = elem.get('href', '').lower()
-        if any(keyword in href for keyword in ['/m/signin', 'bookmark', 'clap']):
+        if _UI_HREF_RE.search(href):
             return True
     
     return False
 
 
+def _replace_with_text(elem) -> None:
+    """Replace an element with its plain text content.
+    
+    Args:
+        elem: lxml element to replace
+    """
+    text = _text(elem)
+    for child in list(elem):
+        elem.remove(child)
+    elem.text = text
+    elem.drop_tag()
+
+
 def _clean_content_element(elem) -> bool:
     """Clean a content element by removing UI elements.
     
     Args:
-        elem: BeautifulSoup element to clean
+        elem: lxml element to clean
         
     Returns:
         bool: True if element should be kept, False if removed
     """
-    if not elem:
+    if elem is None:
         return False
     
     # Remove UI elements
-    for ui_elem in list(elem.find_all(['script', 'style', 'nav', 'button'])):
-        if ui_elem:
-            ui_elem.decompose()
+    etree.strip_elements(elem, 'script', 'style', 'nav', 'button', with_tail=False)
     
     # Clean UI links
-    for link in list(elem.find_all('a')):
-        if link and _is_ui_element(link):
-            link.replace_with(link.get_text())
+    for link in elem.xpath('.//a'):
+        if _is_ui_element(link):
+            _replace_with_text(link)
     
     # Remove empty styling divs/spans
-    for empty_elem in list(elem.find_all(['div', 'span'])):
-        if not empty_elem:
-            continue
-        try:
-            text = empty_elem.get_text().strip()
-            if not text and not empty_elem.find(['img', 'figure', 'pre', 'code']):
-                classes = empty_elem.get('class')
-                if classes:
-                    class_str = ' '.join(classes) if isinstance(classes, list) else str(classes)
-                    if any(ui_class in class_str.lower() for ui_class in 
-                           ['button', 'icon', 'tooltip', 'menu', 'nav']):
-                        empty_elem.decompose()
-        except (AttributeError, TypeError):
-            continue
+    for empty_elem in _UI_STYLED_XPATH(elem):
+        if not _text(empty_elem).strip():
+            empty_elem.drop_tree()
     
     # Remove nested html/body tags
-    for nested in list(elem.find_all(['html', 'body'])):
-        if nested:
-            nested.unwrap()
+    etree.strip_tags(elem, 'html', 'body')
     
     return True
 
 
-def extract_article_body(html: str) -> Optional[str]:
+def _remove_original_links(elem) -> None:
+    """Remove freedium's "Go to the original" links from a content element.
+    
+    Args:
+        elem: lxml element to clean
+    """
+    # One pass over the links: bypass anchors and "Go to the original" text
+    for link in elem.xpath('.//a'):
+        if ('#bypass' in link.get('href', '') or
+                _text(link).strip() in ['< Go to the original', 'Go to the original']):
+            link.drop_tree()
+
+
+def extract_article_body(tree, json_ld_data: Optional[list] = None) -> Optional[str]:
     """Extract article body content from HTML.
     
     Uses the postBody div which contains the complete article in correct order.
     Also handles freedium.cfd structure for member-only articles.
     
     Args:
-        html: HTML content
+        tree: Parsed HTML document (lxml element, not modified)
+        json_ld_data: JSON-LD objects already extracted from tree, if any
         
     Returns:
         str: Article body HTML or None if not found
     """
-    soup = BeautifulSoup(html, 'lxml')
-    
     # Method 1: Extract from postBody (most reliable - preserves order)
-    post_body = soup.find('div', {'data-testid': 'postBody'})
-    if post_body:
+    post_bodies = tree.xpath('//div[@data-testid="postBody"]')
+    if post_bodies:
+        post_body = post_bodies[0]
         # Check if postBody contains an article tag
-        article_tag = post_body.find('article')
-        source = article_tag if article_tag else post_body
+        article_tags = post_body.xpath('.//article')
+        source = article_tags[0] if article_tags else post_body
         
         # Create a clean copy
-        source_copy = BeautifulSoup(str(source), 'lxml').find(source.name)
-        if source_copy:
-            _clean_content_element(source_copy)
-            
-            # Return if we have substantial content
-            if len(source_copy.get_text()) > 500:
-                return str(source_copy)
+        source_copy = _copy_element(source)
+        _clean_content_element(source_copy)
+        
+        # Return if we have substantial content
+        if len(_text(source_copy)) > 500:
+            return _to_html(source_copy)
         
         # Fallback: return postBody if it has content
-        if len(post_body.get_text()) > 500:
-            return str(post_body)
+        if len(_text(post_body)) > 500:
+            return _to_html(post_body)
     
     # Method 1.5: Extract from freedium.cfd structure (for member-only articles)
     # Freedium uses a div with class "main-content" or a div with Georgia serif font
     # The serif div typically has more complete content, so check both and use the one with more content
     
-    main_content = soup.find('div', class_='main-content')
-    main_content_text_len = len(main_content.get_text()) if main_content else 0
+    main_contents = tree.xpath('//div[contains(concat(" ", normalize-space(@class), " "), " main-content ")]')
+    main_content = main_contents[0] if main_contents else None
+    main_content_text_len = len(_text(main_content)) if main_content is not None else 0
     
     # Find the div with Georgia serif font (freedium's content wrapper - usually has more content)
-    serif_divs = soup.find_all('div', style=lambda x: x and 'Georgia' in str(x) if x else False)
+    serif_divs = tree.xpath('//div[contains(@style, "Georgia")]')
     best_serif_div = None
     best_serif_len = 0
     
     for serif_div in serif_divs:
-        text_len = len(serif_div.get_text())
+        text_len = len(_text(serif_div))
         if text_len > best_serif_len:
             best_serif_len = text_len
             best_serif_div = serif_div
@@ -270,32 +445,22 @@ def extract_article_body(html: str) -> Optional[str]:
     # Use whichever has more content
     if best_serif_len > main_content_text_len and best_serif_len > 1000:
         # Use serif div
-        serif_div_copy = BeautifulSoup(str(best_serif_div), 'lxml').find(best_serif_div.name, style=best_serif_div.get('style'))
-        if serif_div_copy:
-            # Remove "Go to the original" link specifically
-            for link in serif_div_copy.find_all('a', href=lambda x: x and '#bypass' in str(x) if x else False):
-                link.decompose()
-            # Also remove links with "Go to the original" text
-            for link in serif_div_copy.find_all('a'):
-                if link.get_text().strip() in ['< Go to the original', 'Go to the original']:
-                    link.decompose()
-            _clean_content_element(serif_div_copy)
-            return str(serif_div_copy)
+        serif_div_copy = _copy_element(best_serif_div)
+        # Remove "Go to the original" link specifically
+        _remove_original_links(serif_div_copy)
+        _clean_content_element(serif_div_copy)
+        return _to_html(serif_div_copy)
     elif main_content_text_len > 1000:
         # Use main-content
-        main_content_copy = BeautifulSoup(str(main_content), 'lxml').find('div', class_='main-content')
-        if main_content_copy:
-            # Remove "Go to the original" link
-            for link in main_content_copy.find_all('a', href=lambda x: x and '#bypass' in str(x) if x else False):
-                link.decompose()
-            for link in main_content_copy.find_all('a'):
-                if link.get_text().strip() in ['< Go to the original', 'Go to the original']:
-                    link.decompose()
-            _clean_content_element(main_content_copy)
-            return str(main_content_copy)
+        main_content_copy = _copy_element(main_content)
+        # Remove "Go to the original" link
+        _remove_original_links(main_content_copy)
+        _clean_content_element(main_content_copy)
+        return _to_html(main_content_copy)
     
     # Method 2: Extract from JSON-LD articleBody (fallback)
-    json_ld_data = extract_json_ld(html)
+    if json_ld_data is None:
+        json_ld_data = extract_json_ld(tree)
     article_data = extract_article_from_json_ld(json_ld_data)
     if article_data and 'articleBody' in article_data:
         body = article_data['articleBody']
@@ -303,12 +468,11 @@ def extract_article_body(html: str) -> Optional[str]:
             return body
     
     # Method 3: Extract from article tag (last resort)
-    article = soup.find('article')
-    if article and len(article.get_text()) > 500:
-        article_copy = BeautifulSoup(str(article), 'lxml').find('article')
-        if article_copy:
-            _clean_content_element(article_copy)
-            return str(article_copy)
+    articles = tree.xpath('//article')
+    if articles and len(_text(articles[0])) > 500:
+        article_copy = _copy_element(articles[0])
+        _clean_content_element(article_copy)
+        return _to_html(article_copy)
     
     return None
 
@@ -327,10 +491,11 @@ def parse_article(html: str, url: Optional[str] = None) -> ArticleData:
         ParseError: If the article cannot be parsed
     """
     article = ArticleData()
-    soup = BeautifulSoup(html, 'lxml')
+    # Parse once and share the tree with every extractor
+    tree = _parse_html(html)
     
     # Extract JSON-LD data first (most reliable)
-    json_ld_data = extract_json_ld(html)
+    json_ld_data = extract_json_ld(tree)
     article_json = extract_article_from_json_ld(json_ld_data)
     
     if article_json:
@@ -366,7 +531,7 @@ def parse_article(html: str, url: Optional[str] = None) -> ArticleData:
         article.body = article_json.get('articleBody')
     
     # Fallback to meta tags
-    meta_data = extract_article_from_meta_tags(html)
+    meta_data = extract_article_from_meta_tags(tree)
     if not article.title and meta_data.get('title'):
         article.title = meta_data['title']
     if not article.author and meta_data.get('author'):
@@ -378,9 +543,8 @@ def parse_article(html: str, url: Optional[str] = None) -> ArticleData:
     
     # Additional fallback for title - try h1 tags
     if not article.title:
-        h1_tags = soup.find_all('h1')
-        for h1 in h1_tags:
-            text = h1.get_text().strip()
+        for h1 in tree.iter('h1'):
+            text = _text(h1).strip()
             if (text and len(text) > 5 and 
                 text.lower() not in ['medium', 'home', 'about', 'sign in', 'sign up']):
                 article.title = text
@@ -388,7 +552,8 @@ def parse_article(html: str, url: Optional[str] = None) -> ArticleData:
     
     # Extract body HTML (prefer HTML over JSON-LD for better structure)
     if not article.body:
-        article.body = extract_article_body(html)
+        # Hand over the JSON-LD decoded above so it isn't decoded again
+        article.body = extract_article_body(tree, json_ld_data)
     
     # Validate we have body
     if not article.body:
@@ -397,7 +562,6 @@ def parse_article(html: str, url: Optional[str] = None) -> ArticleData:
     # Use fallback title if we couldn't extract one
     if not article.title:
         if url:
-            from urllib.parse import urlparse
             parsed = urlparse(url)
             path_parts = [p for p in parsed.path.split('/') if p]
             if path_parts:
@@ -408,3 +572,43 @@ def parse_article(html: str, url: Optional[str] = None) -> ArticleData:
             article.title = "Medium Article"
     
     return article
+
+
+def parse_articles(htmls: Iterable[str],
+                   urls: Optional[Iterable[Optional[str]]] = None,
+                   max_workers: Optional[int] = None) -> ArticleBatch:
+    """Parse many Medium articles into a column-oriented batch.
+    
+    Articles are parsed in a process pool so lxml and the extraction code
+    run on every core; a single article or worker is parsed in-process.
+    
+    Args:
+        htmls: HTML content of each article
+        urls: Optional URLs matching htmls (used for fallback titles)
+        max_workers: Number of worker processes (default: CPU count)
+        
+    Returns:
+        ArticleBatch: Parsed articles, in input order
+        
+    Raises:
+        ParseError: If any article cannot be parsed
+        ValueError: If urls is given and its length differs from htmls
+    """
+    htmls = list(htmls)
+    urls = list(urls) if urls is not None else [None] * len(htmls)
+    if len(urls) != len(htmls):
+        raise ValueError(f"Got {len(urls)} URLs for {len(htmls)} articles")
+    workers = min(max_workers or os.cpu_count() or 1, len(htmls))
+    
+    if workers <= 1:
+        articles = map(parse_article, htmls, urls)
+    else:
+        # A few chunks per worker keeps IPC overhead low while balancing load
+        chunksize = max(1, len(htmls) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            articles = list(executor.map(parse_article, htmls, urls, chunksize=chunksize))
+    
+    batch = ArticleBatch()
+    for article in articles:
+        batch.append(article)
+    return batch
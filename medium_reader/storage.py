@@ -6,15 +6,28 @@ from pathlib import Path
 from urllib.parse import urlparse
 
 
+# Characters not allowed in filenames on common filesystems, mapped to '-'
+_INVALID_FILENAME_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', '-'))
+# Runs of whitespace and hyphens, collapsed to a single hyphen
+_SEPARATOR_RUN_RE = re.compile(r'[\s-]+')
+
+
+def _storage_directory_path():
+    """Get the storage directory for articles as a plain string path.
+    
+    Returns:
+        str: Path to the articles storage directory (~/.medium-reader/articles/)
+    """
+    return os.path.join(os.path.expanduser('~'), '.medium-reader', 'articles')
+
+
 def get_storage_directory():
     """Get the storage directory for articles.
     
     Returns:
         Path: Path to the articles storage directory (~/.medium-reader/articles/)
     """
-    home_dir = Path.home()
-    storage_dir = home_dir / ".medium-reader" / "articles"
-    return storage_dir
+    return Path(_storage_directory_path())
 
 
 def ensure_storage_directory():
@@ -23,9 +36,9 @@ def ensure_storage_directory():
     Returns:
         Path: Path to the articles storage directory
     """
-    storage_dir = get_storage_directory()
-    storage_dir.mkdir(parents=True, exist_ok=True)
-    return storage_dir
+    storage_dir = _storage_directory_path()
+    os.makedirs(storage_dir, exist_ok=True)
+    return Path(storage_dir)
 
 
 def sanitize_filename(filename):
@@ -38,11 +51,11 @@ def sanitize_filename(filename):
         str: Sanitized filename safe for filesystem
     """
     # Remove or replace invalid characters
-    filename = re.sub(r'[<>:"/\\|?*]', '-', filename)
+    filename = filename.translate(_INVALID_FILENAME_CHARS)
     # Remove leading/trailing spaces and dots
     filename = filename.strip(' .')
     # Replace multiple spaces/hyphens with single hyphen
-    filename = re.sub(r'[\s-]+', '-', filename)
+    filename = _SEPARATOR_RUN_RE.sub('-', filename)
     # Limit length
     if len(filename) > 200:
         filename = filename[:200]
@@ -77,6 +90,36 @@ def generate_filename_from_url(url, title=None):
     return base_name
 
 
+def _candidate_filenames(base_filename):
+    """Yield base_filename, then numbered variants of it.
+    
+    Args:
+        base_filename: Base filename
+        
+    Yields:
+        str: base_filename, name-1.html, name-2.html, ...
+    """
+    yield base_filename
+    name_without_ext = base_filename.rsplit('.html', 1)[0]
+    counter = 1
+    while True:
+        yield f"{name_without_ext}-{counter}.html"
+        counter += 1
+
+
+def _existing_filenames(storage_dir):
+    """List the storage directory once, casefolded for case-insensitive filesystems.
+    
+    Args:
+        storage_dir: Directory to list
+        
+    Returns:
+        set: Casefolded names of the directory's entries
+    """
+    with os.scandir(storage_dir) as entries:
+        return {entry.name.casefold() for entry in entries}
+
+
 def get_unique_filename(storage_dir, base_filename):
     """Get a unique filename if the file already exists.
     
@@ -87,21 +130,34 @@ def get_unique_filename(storage_dir, base_filename):
     Returns:
         str: Unique filename (may be the same as base_filename if it doesn't exist)
     """
-    filepath = storage_dir / base_filename
-    
-    if not filepath.exists():
-        return base_filename
+    # List the directory once and probe candidates in memory
+    existing = _existing_filenames(storage_dir)
+    for filename in _candidate_filenames(base_filename):
+        if filename.casefold() not in existing:
+            return filename
+
+
+def _create_unique_file(storage_dir, base_filename):
+    """Create a new, empty file under a unique name in the storage directory.
     
-    # If file exists, append a number
-    name_without_ext = base_filename.rsplit('.html', 1)[0]
-    counter = 1
+    The name comes from get_unique_filename; the final check is left to
+    O_EXCL so a file created in the meantime is never overwritten, and the
+    directory is listed again to pick the next free name.
     
+    Args:
+        storage_dir: Directory to create the file in
+        base_filename: Base filename
+        
+    Returns:
+        tuple: (file descriptor open for writing, path of the created file)
+    """
     while True:
-        new_filename = f"{name_without_ext}-{counter}.html"
-        new_filepath = storage_dir / new_filename
-        if not new_filepath.exists():
-            return new_filename
-        counter += 1
+        filepath = os.path.join(storage_dir, get_unique_filename(storage_dir, base_filename))
+        try:
+            fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            continue
+        return fd, filepath
 
 
 def save_article(html_content, url, title=None):
@@ -115,13 +171,20 @@ def save_article(html_content, url, title=None):
     Returns:
         Path: Path to the saved file
     """
-    storage_dir = ensure_storage_directory()
+    # Work with plain string paths and only build a Path for the caller
+    storage_dir = _storage_directory_path()
+    os.makedirs(storage_dir, exist_ok=True)
     base_filename = generate_filename_from_url(url, title)
-    filename = get_unique_filename(storage_dir, base_filename)
-    filepath = storage_dir / filename
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # Encode once (before creating the file, so a failure leaves nothing
+    # behind) and hand the bytes to the kernel in as few writes as it takes
+    data = memoryview(html_content.encode('utf-8'))
+    fd, filepath = _create_unique_file(storage_dir, base_filename)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
     
-    return filepath
+    return Path(filepath)
 
@@ -23,9 +23,14 @@ setup(
     python_requires=">=3.10",
     install_requires=[
         "requests>=2.31.0",
-        "beautifulsoup4>=4.12.0",
         "lxml>=4.9.0",
+        "urllib3[brotli,zstd]>=2.0.0",
     ],
+    extras_require={
+        "async": ["aiohttp>=3.9.0"],
+        "cache": ["requests-cache>=1.1.0"],
+        "fast": ["orjson>=3.9.0"],
+    },
     entry_points={
         "console_scripts": [
             "medium-read=medium_reader.cli:main",